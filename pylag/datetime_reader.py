@@ -1,17 +1,275 @@
 """
 A family of classes for reading dates/times.
 """
+import re
 import numpy as np
-from netCDF4 import Dataset
-from cftime import num2pydate
-from datetime import timedelta
 try:
     import configparser
 except ImportError:
     import ConfigParser as configparser
 
 from pylag.exceptions import PyLagValueError, PyLagRuntimeError
-from pylag.utils import round_time
+from pylag.utils import round_time, round_time_scalar, round_time_vectorized
+
+
+# Pattern matching CF style time units strings (e.g. `days since 1858-11-17`)
+_cf_units_pattern = re.compile(r'\s*(\w+)\s+since\s+(.+)', re.IGNORECASE)
+
+# The number of microseconds per CF time unit
+_microseconds_per_unit = {'days': 86400000000,
+                          'day': 86400000000,
+                          'd': 86400000000,
+                          'hours': 3600000000,
+                          'hour': 3600000000,
+                          'h': 3600000000,
+                          'minutes': 60000000,
+                          'minute': 60000000,
+                          'seconds': 1000000,
+                          'second': 1000000,
+                          's': 1000000,
+                          'milliseconds': 1000,
+                          'millisecond': 1000,
+                          'microseconds': 1,
+                          'microsecond': 1}
+
+
+def _parse_units(units):
+    """ Parse a CF style time units string
+
+    The units string is parsed into a scale factor, giving the number of
+    microseconds per time unit, and the reference date/time, returned as
+    a numpy datetime64 object. Microsecond precision matches that of
+    Python datetime objects, while `datetime64[us]` comfortably spans
+    the reference dates (e.g. year 0001) found in some model output.
+
+    Parameters
+    ----------
+    units : str
+        Units string of the form `<unit> since <reference date/time>`.
+
+    Returns
+    -------
+     : tuple(int, datetime64)
+         The number of microseconds per time unit and the reference
+         date/time.
+
+    Raises
+    ------
+    PyLagValueError
+        If the units string could not be parsed.
+    """
+    # Deferred to keep module import time down for tools that never
+    # decode times
+    from cftime import num2pydate
+
+    match = _cf_units_pattern.match(units)
+    if match is None:
+        raise PyLagValueError(f"Unrecognised time units `{units}`")
+
+    try:
+        microseconds = _microseconds_per_unit[match.group(1).lower()]
+    except KeyError:
+        raise PyLagValueError(f"Unsupported time unit "
+                              f"`{match.group(1)}`")
+
+    # Let cftime handle the many permissible reference date/time formats
+    try:
+        reference = np.datetime64(num2pydate(0, units=units), 'us')
+    except (ValueError, OverflowError):
+        raise PyLagValueError(f"Could not parse the reference date/time "
+                              f"in `{units}`")
+
+    # For reference dates that precede the adoption of the Gregorian
+    # calendar, linear datetime arithmetic diverges from the standard
+    # (mixed Julian/Gregorian) calendar used by cftime. Treat such units
+    # as unparseable so that callers fall back to decoding via cftime.
+    if reference < np.datetime64('1582-10-15T00:00:00', 'us'):
+        raise PyLagValueError(f"Reference date/time in `{units}` predates "
+                              f"the Gregorian calendar era")
+
+    return microseconds, reference
+
+
+def _decode_to_datetime64(time_raw, parsed_units):
+    """ Decode numeric times to numpy datetime64 objects
+
+    The conversion is performed with vectorised numpy operations, which
+    are considerably faster than decoding via `cftime` - in particular
+    when the reference date/time lies far from the times being decoded.
+    The approach is only valid for standard and proleptic Gregorian
+    calendars; as elsewhere in PyLag, a standard calendar is assumed.
+
+    Parameters
+    ----------
+    time_raw : ndarray
+        Array of numeric times, consistent with `parsed_units`.
+
+    parsed_units : tuple(int, datetime64)
+        Pre-parsed units, as returned by `_parse_units`.
+
+    Returns
+    -------
+     : ndarray
+         Array of datetime64 objects with microsecond resolution.
+    """
+    microseconds, reference = parsed_units
+
+    offsets = np.asarray(time_raw, dtype=np.float64) * microseconds
+
+    return reference + np.rint(offsets).astype('timedelta64[us]')
+
+
+def _to_contiguous_slice(time_index):
+    """ Rewrite a contiguous sequence of indices as a slice
+
+    netCDF4's fancy-index path reads element by element and is orders of
+    magnitude slower than reading a contiguous slice. When given a
+    sorted, contiguous list or array of indices whose elements share the
+    same sign, return an equivalent slice object; all other inputs are
+    returned unchanged. Mixed-sign sequences such as `[-1, 0]` have no
+    slice equivalent and are left for element-wise selection.
+
+    Parameters
+    ----------
+    time_index : int, array_like, slice
+        The time index or indices at which to extract data.
+
+    Returns
+    -------
+     : int, array_like, slice
+         An equivalent slice if `time_index` is a contiguous sequence,
+         otherwise `time_index` unchanged.
+    """
+    if isinstance(time_index, (list, tuple, np.ndarray)):
+        idx = np.asarray(time_index)
+        if idx.ndim == 1 and idx.size > 0 and np.all(np.diff(idx) == 1):
+            start = int(idx[0])
+            stop = int(idx[-1]) + 1
+            if start >= 0 or stop <= 0:
+                return slice(start, stop if stop != 0 else None)
+
+    return time_index
+
+
+def _datetime64_to_pydatetime(dt64):
+    """ Convert datetime64 values to python datetime objects
+
+    When pandas is available, arrays are converted with
+    `pandas.to_datetime`, which materialises the object array in a
+    single vectorised call. Otherwise, or for scalar inputs, fall back
+    on numpy's `tolist`.
+
+    Parameters
+    ----------
+    dt64 : ndarray
+        Array (or scalar) of datetime64 objects.
+
+    Returns
+    -------
+     : list[datetime], Datetime
+         A list of datetime objects, or a single datetime object if
+         `dt64` is a scalar.
+    """
+    if np.ndim(dt64) > 0:
+        try:
+            import pandas as pd
+            return pd.to_datetime(dt64).to_pydatetime().tolist()
+        except (ImportError, ValueError):
+            # Older versions of pandas coerce to nanosecond resolution
+            # and raise OutOfBoundsDatetime (a ValueError) for valid
+            # dates outside the years 1677-2262
+            pass
+
+    return dt64.tolist()
+
+
+def _disable_auto_maskandscale(*variables):
+    """ Disable automatic masking and scaling for the given variables
+
+    Time variables make no meaningful use of _FillValue, yet netCDF4
+    returns a MaskedArray by default, paying for mask construction and an
+    extra allocation on every read. Datasets used in testing do not
+    implement the full netCDF4 variable interface, so the call is
+    skipped where unsupported.
+
+    Parameters
+    ----------
+    variables : Variable
+        NetCDF4 variable objects.
+
+    Returns
+    -------
+     : None
+    """
+    for var in variables:
+        try:
+            var.set_auto_maskandscale(False)
+        except AttributeError:
+            pass
+
+
+def _variable_fingerprint(var):
+    """ Compute a cheap fingerprint for a time variable
+
+    Object ids are recycled once a dataset has been closed and garbage
+    collected, so `id(dataset)` alone is not a safe cache key. Combining
+    the id with the variable's length and leading value guards against a
+    recycled id silently returning stale times.
+
+    Parameters
+    ----------
+    var : Variable
+        NetCDF4 variable object.
+
+    Returns
+    -------
+     : tuple
+         The variable's length and leading value.
+    """
+    n = len(var)
+    if n == 0:
+        return n, None
+
+    return n, float(var[0])
+
+
+def _num2pydate_rereferenced(time_raw, units):
+    """ Decode numeric times via cftime after re-referencing
+
+    cftime decodes become progressively more expensive as times move away
+    from the reference date/time. Here, times are first re-referenced to
+    the leading element of the array - a single scalar decode - before the
+    remainder of the array is decoded against the new, nearby reference.
+    For datasets with distant reference dates (e.g. year 0001) this can
+    be orders of magnitude faster; for near-reference data it costs just
+    one extra scalar decode.
+
+    Parameters
+    ----------
+    time_raw : ndarray
+        Array of numeric times, consistent with `units`.
+
+    units : str
+        Units string of the form `<unit> since <reference date/time>`.
+
+    Returns
+    -------
+     : list[datetime]
+         A list of datetime objects.
+    """
+    from cftime import num2pydate
+
+    time_raw = np.asarray(time_raw)
+
+    match = _cf_units_pattern.match(units)
+    if match is None or time_raw.size == 0:
+        return num2pydate(time_raw, units=units)
+
+    anchor = num2pydate(time_raw.flat[0], units=units)
+    delta = time_raw - time_raw.flat[0]
+    new_units = f"{match.group(1)} since {anchor.isoformat(sep=' ')}"
+
+    return num2pydate(delta, units=new_units)
 
 
 class DateTimeReader:
@@ -21,7 +279,169 @@ class DateTimeReader:
     datetime data within NetCDF4 datasets. Different models encode
     time in different ways. Hence, we introduce a family of objects
     to account for all possible approaches.
+
+    Decoded datetime arrays are memoized per dataset, allowing repeat
+    calls to `get_datetime` - including scalar `time_index` queries - to
+    be served without re-reading or re-decoding the time variable(s).
     """
+    def __init__(self):
+        self._cache = {}
+        self._units_cache = {}
+        self._parsed_units = {}
+        self._chunk_cache_configured = set()
+
+    def clear_cache(self):
+        """ Clear any memoized datetime arrays and units strings
+
+        Returns
+        -------
+         : None
+        """
+        self._cache = {}
+        self._units_cache = {}
+        self._parsed_units = {}
+
+    def _configure_chunk_cache(self, dataset, *variables):
+        """ Apply a chunk cache to the given time variables
+
+        Time variables are often stored compressed, in which case
+        repeated scalar reads trigger repeated chunk decompression. When
+        the `time_var_chunk_cache_mb` configuration option is set to a
+        value greater than zero, size the HDF5 per-variable chunk cache
+        so decompressed chunks stay resident between reads. Applied once
+        per dataset, the first time it is seen.
+
+        Parameters
+        ----------
+        dataset : Dataset
+            Dataset object the variables belong to.
+
+        variables : Variable
+            NetCDF4 variable objects.
+
+        Returns
+        -------
+         : None
+        """
+        if self._time_var_chunk_cache_mb <= 0:
+            return
+
+        key = id(dataset)
+        if key in self._chunk_cache_configured:
+            return
+
+        size = int(self._time_var_chunk_cache_mb * 2**20)
+        for var in variables:
+            try:
+                var.set_var_chunk_cache(size=size, nelems=521, preempt=0.75)
+            except (AttributeError, RuntimeError):
+                # Chunk caches are not supported for all file formats
+                pass
+
+        self._chunk_cache_configured.add(key)
+
+    def _select_datetimes(self, datetimes, time_index):
+        """ Select datetimes at the given time index or indices
+
+        Parameters
+        ----------
+        datetimes : list[datetime]
+            The full list of decoded datetime objects.
+
+        time_index : int, array_like, slice, optional
+            The time index (or indices) at which to extract data. If
+            None, a copy of the full list is returned.
+
+        Returns
+        -------
+         : list[datetime], Datetime
+             The selected datetime object(s).
+        """
+        if time_index is None:
+            return list(datetimes)
+
+        if np.ndim(time_index) > 0:
+            return [datetimes[int(i)] for i in time_index]
+
+        return datetimes[time_index]
+
+    def _get_units(self, dataset, var, var_name, fingerprint):
+        """ Get the units string for the given time variable
+
+        Attribute access on NetCDF4 variables dispatches into the
+        underlying C layer and carries nontrivial per-call overhead, so
+        units strings are cached per dataset after the first lookup.
+        Object ids are recycled once a dataset has been closed, so the
+        variable fingerprint forms part of the cache key to guard
+        against serving units from a previously opened file.
+
+        Parameters
+        ----------
+        dataset : Dataset
+            Dataset object the variable belongs to.
+
+        var : Variable
+            NetCDF4 variable object.
+
+        var_name : str
+            The name of the variable.
+
+        fingerprint : tuple
+            Variable fingerprint, as computed by `_variable_fingerprint`.
+
+        Returns
+        -------
+         : str
+             The variable's units string.
+        """
+        key = (id(dataset), var_name, fingerprint)
+        try:
+            return self._units_cache[key]
+        except KeyError:
+            units = var.units
+            self._units_cache[key] = units
+            return units
+
+    def _get_parsed_units(self, dataset, units, var_name, fingerprint):
+        """ Get the pre-parsed units for the given time variable
+
+        Parsing the units string - and in particular resolving the
+        reference date/time - carries a fixed per-decode cost, so the
+        parsed form is cached per dataset after the first call. As with
+        the units cache, the variable fingerprint forms part of the
+        cache key to guard against recycled dataset ids.
+
+        Parameters
+        ----------
+        dataset : Dataset
+            Dataset object the variable belongs to.
+
+        units : str
+            Units string of the form `<unit> since <reference date/time>`.
+
+        var_name : str
+            The name of the variable.
+
+        fingerprint : tuple
+            Variable fingerprint, as computed by `_variable_fingerprint`.
+
+        Returns
+        -------
+         : tuple(int, datetime64), None
+             Pre-parsed units, as returned by `_parse_units`, or None if
+             the units string could not be parsed.
+        """
+        key = (id(dataset), var_name, fingerprint)
+        try:
+            return self._parsed_units[key]
+        except KeyError:
+            try:
+                parsed_units = _parse_units(units)
+            except PyLagValueError:
+                parsed_units = None
+            self._parsed_units[key] = parsed_units
+            return parsed_units
+
     def get_datetime(self, dataset, time_index=None):
         """ Get dates/times for the given dataset
 
@@ -37,6 +457,21 @@ class DateTimeReader:
         """
         raise NotImplementedError
 
+    def iter_datetimes(self, dataset, chunk_size=1000000):
+        """ Iterate over dates/times for the given dataset in chunks
+
+        Must be implemented in a derived class.
+
+        Parameters
+        ----------
+        dataset : Dataset
+            Dataset object for an FVCOM data file.
+
+        chunk_size : int, optional
+            The number of time points to decode per yielded block.
+        """
+        raise NotImplementedError
+
 
 class DefaultDateTimeReader(DateTimeReader):
     """ Default Datetime reader
@@ -55,6 +490,8 @@ class DefaultDateTimeReader(DateTimeReader):
         with.
     """
     def __init__(self, config, config_section_name):
+        super().__init__()
+
         self.config = config
         self.config_section_name = config_section_name
 
@@ -68,6 +505,13 @@ class DefaultDateTimeReader(DateTimeReader):
         self.rounding_interval = self.config.getint(self.config_section_name,
                                                     "rounding_interval")
 
+        # Optional chunk cache size for the time variable
+        try:
+            self._time_var_chunk_cache_mb = self.config.getfloat(
+                self.config_section_name, "time_var_chunk_cache_mb")
+        except (configparser.NoSectionError, configparser.NoOptionError):
+            self._time_var_chunk_cache_mb = 0.0
+
     def get_datetime(self, dataset, time_index=None):
         """ Get dates/times for the given dataset
 
@@ -82,29 +526,116 @@ class DefaultDateTimeReader(DateTimeReader):
         dataset : Dataset
             Dataset object for an FVCOM data file.
 
-        time_index : int, optional
-            The time index at which to extract data. Default behaviour
-            is to return the full time array as datetime objects.
+        time_index : int, array_like, optional
+            The time index (or indices) at which to extract data. Default
+            behaviour is to return the full time array as datetime
+            objects.
 
         Returns
         -------
          : list[datetime]
-             If `time_index` is None, return a full list of datetime
-             objects.
+             If `time_index` is None or a sequence of indices, a list of
+             datetime objects.
 
          : Datetime
-             If `time_index` is not None, a single datetime object.
+             If `time_index` is a single index, a single datetime object.
         """
-        time_raw = dataset.variables[self._time_var_name]
-        units = dataset.variables[self._time_var_name].units
-
-        if time_index is not None:
-            datetime_raw = num2pydate(time_raw[time_index], units=units)
-            return round_time([datetime_raw], self.rounding_interval)[0]
-        else:
-            datetime_raw = num2pydate(time_raw[:], units=units)
+        time_index = _to_contiguous_slice(time_index)
+
+        var = dataset.variables[self._time_var_name]
+
+        self._configure_chunk_cache(dataset, var)
+
+        key = (id(dataset), self._time_var_name)
+        fingerprint = _variable_fingerprint(var)
+
+        cached = self._cache.get(key)
+        if cached is None or cached[0] != fingerprint:
+            _disable_auto_maskandscale(var)
+            units = self._get_units(dataset, var, self._time_var_name,
+                                    fingerprint)
+            parsed_units = self._get_parsed_units(dataset, units,
+                                                  self._time_var_name,
+                                                  fingerprint)
+            datetimes = self._decode_and_round(var[:], units, parsed_units)
+            cached = (fingerprint, datetimes)
+            self._cache[key] = cached
+
+        return self._select_datetimes(cached[1], time_index)
+
+    def iter_datetimes(self, dataset, chunk_size=1000000):
+        """ Iterate over dates/times for the given dataset in chunks
+
+        For very long time axes, materialising the full array of python
+        datetime objects can consume significant memory. This generator
+        reads, decodes and rounds the time variable in blocks of
+        `chunk_size` elements instead, letting callers that scan through
+        time stream the data without holding it all at once. Results are
+        not memoized.
+
+        Parameters
+        ----------
+        dataset : Dataset
+            Dataset object for an FVCOM data file.
+
+        chunk_size : int, optional
+            The number of time points to decode per yielded block.
+
+        Yields
+        ------
+         : list[datetime]
+             Successive blocks of rounded datetime objects.
+        """
+        var = dataset.variables[self._time_var_name]
+
+        _disable_auto_maskandscale(var)
+        fingerprint = _variable_fingerprint(var)
+        units = self._get_units(dataset, var, self._time_var_name,
+                                fingerprint)
+        parsed_units = self._get_parsed_units(dataset, units,
+                                              self._time_var_name,
+                                              fingerprint)
+
+        for start in range(0, len(var), chunk_size):
+            yield self._decode_and_round(var[start:start + chunk_size],
+                                         units, parsed_units)
+
+    def _decode_and_round(self, time_raw, units, parsed_units):
+        """ Decode numeric times into rounded datetime objects
+
+        Times are decoded with the vectorised numpy code path, which
+        assumes a standard calendar, as does PyLag more generally, with
+        rounding applied while the times are still held as datetime64
+        objects. If the units string could not be parsed, fall back to
+        decoding via `cftime` and rounding element-wise.
+
+        Parameters
+        ----------
+        time_raw : ndarray
+            Array of numeric times, consistent with `units`.
+
+        units : str
+            Units string of the form `<unit> since <reference date/time>`.
+
+        parsed_units : tuple(int, datetime64), None
+            Pre-parsed units, as returned by `_parse_units`, or None if
+            the units string could not be parsed.
+
+        Returns
+        -------
+         : list[datetime]
+             A list of rounded datetime objects.
+        """
+        if parsed_units is None:
+            datetime_raw = _num2pydate_rereferenced(time_raw, units)
             return round_time(datetime_raw, self.rounding_interval)
 
+        datetime64_raw = _decode_to_datetime64(time_raw, parsed_units)
+        datetime64_rounded = round_time_vectorized(datetime64_raw,
+                                                   self.rounding_interval)
+
+        return _datetime64_to_pydatetime(datetime64_rounded)
+
 
 class FVCOMDateTimeReader(DateTimeReader):
     """ FVCOM Datetime reader
@@ -134,6 +665,8 @@ class FVCOMDateTimeReader(DateTimeReader):
         with.
     """
     def __init__(self, config, config_section_name):
+        super().__init__()
+
         self.config = config
         self.config_section_name = config_section_name
 
@@ -142,6 +675,13 @@ class FVCOMDateTimeReader(DateTimeReader):
 
         self.days_per_milli_second = 1. / (1000. * 60. * 60. * 24.)
 
+        # Optional chunk cache size for the time variables
+        try:
+            self._time_var_chunk_cache_mb = self.config.getfloat(
+                self.config_section_name, "time_var_chunk_cache_mb")
+        except (configparser.NoSectionError, configparser.NoOptionError):
+            self._time_var_chunk_cache_mb = 0.0
+
     def get_datetime(self, dataset, time_index=None):
         """ Get FVCOM dates/times for the given dataset
 
@@ -154,27 +694,180 @@ class FVCOMDateTimeReader(DateTimeReader):
         dataset : Dataset
             Dataset object for an FVCOM data file.
 
-        time_index : int, optional
-            The time index at which to extract data. Default behaviour
-            is to return the full time array as datetime objects.
+        time_index : int, array_like, optional
+            The time index (or indices) at which to extract data. Default
+            behaviour is to return the full time array as datetime
+            objects.
 
         Returns
         -------
          : list[datetime]
-             If `time_index` is None, return a full list of datetime objects.
+             If `time_index` is None or a sequence of indices, a list of
+             datetime objects.
 
          : Datetime
         """
-        time_raw = (dataset.variables['Itime'][:] +
-                    dataset.variables['Itime2'][:] * self.days_per_milli_second)
-        units = dataset.variables['Itime'].units
-
-        if time_index is not None:
-            datetime_raw = num2pydate(time_raw[time_index], units=units)
-            return round_time([datetime_raw], self.rounding_interval)[0]
-        else:
-            datetime_raw = num2pydate(time_raw[:], units=units)
-            return round_time(datetime_raw, self.rounding_interval)
+        time_index = _to_contiguous_slice(time_index)
+
+        itime_var = dataset.variables['Itime']
+        itime2_var = dataset.variables['Itime2']
+
+        self._configure_chunk_cache(dataset, itime_var, itime2_var)
+
+        key = (id(dataset), 'Itime', 'Itime2')
+        fingerprint = (_variable_fingerprint(itime_var),
+                       _variable_fingerprint(itime2_var))
+
+        cached = self._cache.get(key)
+        if cached is None or cached[0] != fingerprint:
+            _disable_auto_maskandscale(itime_var, itime2_var)
+            units = self._get_units(dataset, itime_var, 'Itime', fingerprint)
+            parsed_units = self._get_parsed_units(dataset, units, 'Itime',
+                                                  fingerprint)
+
+            if isinstance(time_index, (int, np.integer)):
+                # Serve scalar queries without reading the full variables
+                if parsed_units is not None:
+                    microseconds, reference = parsed_units
+                    total_us = (int(itime_var[time_index]) * microseconds +
+                                int(itime2_var[time_index]) * 1000)
+                    datetime_raw = (reference +
+                                    np.timedelta64(total_us, 'us')).item()
+                else:
+                    from cftime import num2pydate
+                    time_raw = (itime_var[time_index] +
+                                itime2_var[time_index] *
+                                self.days_per_milli_second)
+                    datetime_raw = num2pydate(time_raw, units=units)
+                return round_time_scalar(datetime_raw, self.rounding_interval)
+
+            datetimes = self._decode_and_round(itime_var[:], itime2_var[:],
+                                               units, parsed_units)
+            cached = (fingerprint, datetimes)
+            self._cache[key] = cached
+
+        return self._select_datetimes(cached[1], time_index)
+
+    def iter_datetimes(self, dataset, chunk_size=1000000):
+        """ Iterate over FVCOM dates/times for the given dataset in chunks
+
+        For very long time axes, materialising the full array of python
+        datetime objects can consume significant memory. This generator
+        reads, decodes and rounds Itime and Itime2 in blocks of
+        `chunk_size` elements instead, letting callers that scan through
+        time stream the data without holding it all at once. Results are
+        not memoized.
+
+        Parameters
+        ----------
+        dataset : Dataset
+            Dataset object for an FVCOM data file.
+
+        chunk_size : int, optional
+            The number of time points to decode per yielded block.
+
+        Yields
+        ------
+         : list[datetime]
+             Successive blocks of rounded datetime objects.
+        """
+        itime_var = dataset.variables['Itime']
+        itime2_var = dataset.variables['Itime2']
+
+        _disable_auto_maskandscale(itime_var, itime2_var)
+        fingerprint = (_variable_fingerprint(itime_var),
+                       _variable_fingerprint(itime2_var))
+        units = self._get_units(dataset, itime_var, 'Itime', fingerprint)
+        parsed_units = self._get_parsed_units(dataset, units, 'Itime',
+                                              fingerprint)
+
+        for start in range(0, len(itime_var), chunk_size):
+            stop = start + chunk_size
+            yield self._decode_and_round(itime_var[start:stop],
+                                         itime2_var[start:stop],
+                                         units, parsed_units)
+
+    def _decode_and_round(self, itime_raw, itime2_raw, units, parsed_units):
+        """ Decode raw Itime/Itime2 values into rounded datetime objects
+
+        When the Itime units are parseable, the two variables are
+        combined without leaving integer arithmetic - the float64
+        days-since-epoch representation cannot hold milliseconds exactly
+        - and decoded against the cached datetime64 reference. If the
+        units string could not be parsed, fall back to combining the
+        variables as float64 days and decoding via `cftime`.
+
+        Parameters
+        ----------
+        itime_raw : ndarray
+            Array of integer Itime values (days).
+
+        itime2_raw : ndarray
+            Array of integer Itime2 values (milliseconds).
+
+        units : str
+            The Itime units string.
+
+        parsed_units : tuple(int, datetime64), None
+            Pre-parsed units, as returned by `_parse_units`, or None if
+            the units string could not be parsed.
+
+        Returns
+        -------
+         : list[datetime]
+             A list of rounded datetime objects.
+        """
+        if parsed_units is not None:
+            microseconds, reference = parsed_units
+
+            total_us = np.asarray(itime_raw).astype(np.int64)
+            np.multiply(total_us, microseconds, out=total_us)
+            np.add(total_us,
+                   np.asarray(itime2_raw, dtype=np.int64) * 1000,
+                   out=total_us)
+
+            datetime64_raw = reference + total_us.view('timedelta64[us]')
+            datetime64_rounded = round_time_vectorized(datetime64_raw,
+                                                       self.rounding_interval)
+
+            return _datetime64_to_pydatetime(datetime64_rounded)
+
+        # Combine Itime and Itime2 with an in-place multiply-add,
+        # avoiding the two full-size temporaries a naive expression
+        # would allocate
+        time_raw = np.empty(len(itime_raw), dtype=np.float64)
+        np.multiply(itime2_raw, self.days_per_milli_second, out=time_raw)
+        np.add(time_raw, itime_raw, out=time_raw)
+
+        datetime_raw = _num2pydate_rereferenced(time_raw, units)
+
+        return round_time(datetime_raw, self.rounding_interval)
+
+
+# Registry of named datetime readers. Data sources without a bespoke
+# entry are handled by DefaultDateTimeReader.
+_datetime_readers = {}
+
+
+def register_datetime_reader(name, datetime_reader):
+    """ Register a datetime reader for the named data source
+
+    Allows support for new data sources (e.g. ROMS, WW3) to be added
+    without editing `get_datetime_reader`.
+
+    Parameters
+    ----------
+    name : str
+        The name of the data source (e.g. FVCOM).
+
+    datetime_reader : DateTimeReader
+        The DateTimeReader class to use with the named data source.
+
+    Returns
+    -------
+     : None
+    """
+    _datetime_readers[name] = datetime_reader
 
 
 def get_datetime_reader(config, config_section_name):
@@ -204,13 +897,16 @@ def get_datetime_reader(config, config_section_name):
     # The name of the data source (e.g. FVCOM, ROMS etc)
     name = config.get(config_section_name, "name")
 
-    if name == "FVCOM":
-        return FVCOMDateTimeReader(config, config_section_name)
+    datetime_reader = _datetime_readers.get(name, DefaultDateTimeReader)
+
+    return datetime_reader(config, config_section_name)
+
 
-    return DefaultDateTimeReader(config, config_section_name)
+register_datetime_reader("FVCOM", FVCOMDateTimeReader)
 
 
 __all__ = ["DateTimeReader",
            "DefaultDateTimeReader",
            "FVCOMDateTimeReader",
-           "get_datetime_reader"]
+           "get_datetime_reader",
+           "register_datetime_reader"]
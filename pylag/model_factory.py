@@ -11,15 +11,12 @@ except ImportError:
     import ConfigParser as configparser
 
 from pylag.model import OPTModel
-from pylag.arakawa_a_data_reader import ArakawaADataReader
-from pylag.fvcom_data_reader import FVCOMDataReader
-from pylag.roms_data_reader import ROMSDataReader
-from pylag.gotm_data_reader import GOTMDataReader
-from pylag.atmosphere_data_reader import AtmosphereDataReader
-from pylag.waves_data_reader import WavesDataReader
-from pylag.composite_data_reader import CompositeDataReader
 from pylag.exceptions import PyLagValueError
 
+# NB Data reader imports are deferred to the branches that use them -
+# each transitively loads a full model-specific stack, which dispatchers
+# that only need one code path should not pay for.
+
 # Serial imports
 from pylag.mediator import SerialMediator
 
@@ -61,12 +58,16 @@ def get_model(config, datetime_start, datetime_end):
         ocean_mediator = SerialMediator(config, data_source, datetime_start,
                                         datetime_end)
         if ocean_product_name == "ArakawaA":
+            from pylag.arakawa_a_data_reader import ArakawaADataReader
             ocean_data_reader = ArakawaADataReader(config, ocean_mediator)
         elif ocean_product_name == "FVCOM":
+            from pylag.fvcom_data_reader import FVCOMDataReader
             ocean_data_reader = FVCOMDataReader(config, ocean_mediator)
         elif ocean_product_name == "ROMS":
+            from pylag.roms_data_reader import ROMSDataReader
             ocean_data_reader = ROMSDataReader(config, ocean_mediator)
         elif ocean_product_name == "GOTM":
+            from pylag.gotm_data_reader import GOTMDataReader
             ocean_data_reader = GOTMDataReader(config, ocean_mediator)
         else:
             raise PyLagValueError(f"Unsupported ocean data product "
@@ -86,6 +87,7 @@ def get_model(config, datetime_start, datetime_end):
         atmos_mediator = SerialMediator(config, data_source, datetime_start,
                                         datetime_end)
         if atmos_product_name == "standard":
+            from pylag.atmosphere_data_reader import AtmosphereDataReader
             atmos_data_reader = AtmosphereDataReader(config, atmos_mediator)
         else:
             raise PyLagValueError(f"Unsupported atmosphere data product "
@@ -105,6 +107,7 @@ def get_model(config, datetime_start, datetime_end):
         waves_mediator = SerialMediator(config, data_source, datetime_start,
                                         datetime_end)
         if waves_product_name == "standard":
+            from pylag.waves_data_reader import WavesDataReader
             waves_data_reader = WavesDataReader(config, waves_mediator)
         else:
             raise PyLagValueError(f"Unsupported waves data product "
@@ -138,6 +141,7 @@ def get_model(config, datetime_start, datetime_end):
         opt_model = OPTModel(config, waves_data_reader)
     else:
         # Using a combination of data types - requires a composite data reader
+        from pylag.composite_data_reader import CompositeDataReader
         composite_data_reader = CompositeDataReader(config,
                                                     ocean_data_reader,
                                                     atmos_data_reader,
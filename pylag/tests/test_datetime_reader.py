@@ -0,0 +1,253 @@
+from unittest import TestCase
+import numpy.testing as test
+import numpy as np
+import datetime
+
+try:
+    import configparser
+except ImportError:
+    import ConfigParser as configparser
+
+from pylag.datetime_reader import DefaultDateTimeReader, FVCOMDateTimeReader
+from pylag.datetime_reader import get_datetime_reader, register_datetime_reader
+
+
+# Classes designed to mimic behaviours found in the NetCDF4 library
+# -----------------------------------------------------------------
+
+class TestVariable(object):
+    """ Simple test variable class
+
+    TestVariable is desgined to have similar behaviour to NetCDF4 Variable
+    objects with respect to a) returning a data array when indexed, and b)
+    having a units attribute. Introduced here to assist in testing.
+    """
+    def __init__(self, data, units):
+        self.data = np.asarray(data)
+        self.units = units
+
+    def __getitem__(self, key):
+        return self.data[key]
+
+    def __len__(self):
+        return len(self.data)
+
+
+class TestDataset(object):
+    """ Simple test dataset class
+
+    TestDataset's are desgined to have similar behaviour to NetCDF4 Dataset
+    objects. Introduced here to assist in testing.
+    """
+    def __init__(self, variables):
+        self.variables = variables
+
+    def close(self):
+        del(self.variables)
+
+
+# DateTimeReader test classes
+# ---------------------------
+
+class DefaultDateTimeReader_test(TestCase):
+
+    def setUp(self):
+        # Create config
+        self.config = configparser.ConfigParser()
+        self.config.add_section("OCEAN_DATA")
+        self.config.set('OCEAN_DATA', 'name', 'TEST')
+        self.config.set('OCEAN_DATA', 'rounding_interval', '60')
+
+        # Create datetime reader
+        self.datetime_reader = DefaultDateTimeReader(self.config, 'OCEAN_DATA')
+
+        # Create test dataset
+        time_var = TestVariable([0.0, 60.0, 120.0],
+                                'seconds since 2000-01-01 00:00:00')
+        self.dataset = TestDataset({'time': time_var})
+
+    def tearDown(self):
+        del(self.config)
+        del(self.datetime_reader)
+        del(self.dataset)
+
+    def test_get_datetime_returns_the_full_time_array(self):
+        datetimes = self.datetime_reader.get_datetime(self.dataset)
+
+        expected = [datetime.datetime(2000, 1, 1, 0, 0, 0),
+                    datetime.datetime(2000, 1, 1, 0, 1, 0),
+                    datetime.datetime(2000, 1, 1, 0, 2, 0)]
+        test.assert_array_equal(expected, datetimes)
+
+    def test_get_datetime_at_a_given_time_index(self):
+        datetime_out = self.datetime_reader.get_datetime(self.dataset,
+                                                         time_index=1)
+
+        test.assert_equal(datetime.datetime(2000, 1, 1, 0, 1, 0),
+                          datetime_out)
+
+    def test_get_datetime_at_a_contiguous_sequence_of_time_indices(self):
+        datetimes = self.datetime_reader.get_datetime(self.dataset,
+                                                      time_index=[0, 1])
+
+        expected = [datetime.datetime(2000, 1, 1, 0, 0, 0),
+                    datetime.datetime(2000, 1, 1, 0, 1, 0)]
+        test.assert_array_equal(expected, datetimes)
+
+    def test_get_datetime_at_a_non_contiguous_sequence_of_time_indices(self):
+        datetimes = self.datetime_reader.get_datetime(self.dataset,
+                                                      time_index=[0, 2])
+
+        expected = [datetime.datetime(2000, 1, 1, 0, 0, 0),
+                    datetime.datetime(2000, 1, 1, 0, 2, 0)]
+        test.assert_array_equal(expected, datetimes)
+
+    def test_get_datetime_at_a_mixed_sign_sequence_of_time_indices(self):
+        datetimes = self.datetime_reader.get_datetime(self.dataset,
+                                                      time_index=[-1, 0])
+
+        expected = [datetime.datetime(2000, 1, 1, 0, 2, 0),
+                    datetime.datetime(2000, 1, 1, 0, 0, 0)]
+        test.assert_array_equal(expected, datetimes)
+
+    def test_iter_datetimes_yields_the_time_array_in_chunks(self):
+        blocks = list(self.datetime_reader.iter_datetimes(self.dataset,
+                                                          chunk_size=2))
+
+        test.assert_equal(2, len(blocks))
+        test.assert_array_equal([datetime.datetime(2000, 1, 1, 0, 0, 0),
+                                 datetime.datetime(2000, 1, 1, 0, 1, 0)],
+                                blocks[0])
+        test.assert_array_equal([datetime.datetime(2000, 1, 1, 0, 2, 0)],
+                                blocks[1])
+
+    def test_get_datetime_results_are_memoized_per_dataset(self):
+        datetimes_first = self.datetime_reader.get_datetime(self.dataset)
+
+        # Perturb the underlying data. With the leading value and array
+        # length unchanged, the reader should return memoized datetimes.
+        self.dataset.variables['time'].data[1] = 90.0
+        datetimes_second = self.datetime_reader.get_datetime(self.dataset)
+        test.assert_array_equal(datetimes_first, datetimes_second)
+
+        # After clearing the cache the new values should be picked up
+        self.datetime_reader.clear_cache()
+        datetime_out = self.datetime_reader.get_datetime(self.dataset,
+                                                         time_index=1)
+        test.assert_equal(datetime.datetime(2000, 1, 1, 0, 2, 0),
+                          datetime_out)
+
+    def test_get_datetime_rereads_units_when_the_time_variable_changes(self):
+        self.datetime_reader.get_datetime(self.dataset)
+
+        # Mimic a recycled dataset id by swapping in a time variable with
+        # a different reference epoch without clearing any caches. The
+        # changed fingerprint should force the units to be re-read.
+        self.dataset.variables['time'] = TestVariable(
+            [0.0, 0.5], 'days since 1858-11-17 00:00:00')
+
+        datetimes = self.datetime_reader.get_datetime(self.dataset)
+
+        expected = [datetime.datetime(1858, 11, 17, 0, 0, 0),
+                    datetime.datetime(1858, 11, 17, 12, 0, 0)]
+        test.assert_array_equal(expected, datetimes)
+
+    def test_get_datetime_with_a_distant_reference_date(self):
+        # Times given in fractional days since the Modified Julian Date epoch
+        time_var = TestVariable([51544.0, 51544.5],
+                                'days since 1858-11-17 00:00:00')
+        dataset = TestDataset({'time': time_var})
+
+        datetimes = self.datetime_reader.get_datetime(dataset)
+
+        expected = [datetime.datetime(2000, 1, 1, 0, 0, 0),
+                    datetime.datetime(2000, 1, 1, 12, 0, 0)]
+        test.assert_array_equal(expected, datetimes)
+
+
+class FVCOMDateTimeReader_test(TestCase):
+
+    def setUp(self):
+        # Create config
+        self.config = configparser.ConfigParser()
+        self.config.add_section("OCEAN_DATA")
+        self.config.set('OCEAN_DATA', 'name', 'FVCOM')
+        self.config.set('OCEAN_DATA', 'rounding_interval', '3600')
+
+        # Create datetime reader
+        self.datetime_reader = FVCOMDateTimeReader(self.config, 'OCEAN_DATA')
+
+        # Create test dataset
+        itime_var = TestVariable([57000, 57000],
+                                 'days since 1858-11-17 00:00:00')
+        itime2_var = TestVariable([0, 3600000], 'msec since 00:00:00')
+        self.dataset = TestDataset({'Itime': itime_var, 'Itime2': itime2_var})
+
+    def tearDown(self):
+        del(self.config)
+        del(self.datetime_reader)
+        del(self.dataset)
+
+    def test_get_datetime_returns_the_full_time_array(self):
+        datetimes = self.datetime_reader.get_datetime(self.dataset)
+
+        reference = datetime.datetime(1858, 11, 17, 0, 0, 0)
+        expected = [reference + datetime.timedelta(days=57000),
+                    reference + datetime.timedelta(days=57000, hours=1)]
+        test.assert_array_equal(expected, datetimes)
+
+    def test_get_datetime_at_a_given_time_index(self):
+        datetime_out = self.datetime_reader.get_datetime(self.dataset,
+                                                         time_index=1)
+
+        reference = datetime.datetime(1858, 11, 17, 0, 0, 0)
+        test.assert_equal(reference + datetime.timedelta(days=57000, hours=1),
+                          datetime_out)
+
+    def test_iter_datetimes_yields_the_time_array_in_chunks(self):
+        blocks = list(self.datetime_reader.iter_datetimes(self.dataset,
+                                                          chunk_size=1))
+
+        reference = datetime.datetime(1858, 11, 17, 0, 0, 0)
+        test.assert_equal(2, len(blocks))
+        test.assert_array_equal([reference + datetime.timedelta(days=57000)],
+                                blocks[0])
+        test.assert_array_equal([reference + datetime.timedelta(days=57000,
+                                                                hours=1)],
+                                blocks[1])
+
+
+class GetDateTimeReader_test(TestCase):
+
+    def setUp(self):
+        # Create config
+        self.config = configparser.ConfigParser()
+        self.config.add_section("OCEAN_DATA")
+        self.config.set('OCEAN_DATA', 'name', 'FVCOM')
+        self.config.set('OCEAN_DATA', 'rounding_interval', '3600')
+
+    def tearDown(self):
+        del(self.config)
+
+    def test_get_a_fvcom_datetime_reader(self):
+        datetime_reader = get_datetime_reader(self.config, 'OCEAN_DATA')
+
+        self.assertIsInstance(datetime_reader, FVCOMDateTimeReader)
+
+    def test_get_a_default_datetime_reader(self):
+        self.config.set('OCEAN_DATA', 'name', 'TEST')
+
+        datetime_reader = get_datetime_reader(self.config, 'OCEAN_DATA')
+
+        self.assertIsInstance(datetime_reader, DefaultDateTimeReader)
+
+    def test_get_a_registered_datetime_reader(self):
+        class TestDateTimeReader(DefaultDateTimeReader):
+            pass
+
+        register_datetime_reader('TEST_READER', TestDateTimeReader)
+        self.config.set('OCEAN_DATA', 'name', 'TEST_READER')
+
+        datetime_reader = get_datetime_reader(self.config, 'OCEAN_DATA')
+
+        self.assertIsInstance(datetime_reader, TestDateTimeReader)
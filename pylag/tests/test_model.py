@@ -2,10 +2,7 @@ from unittest import TestCase
 import numpy.testing as test
 import numpy as np
 
-try:
-    import configparser
-except ImportError:
-    import ConfigParser as configparser
+import configparser
 
 from pylag.exceptions import PyLagValueError, PyLagRuntimeError
 from pylag.model import OPTModel
@@ -13,27 +10,39 @@ from pylag.model import OPTModel
 from pylag.mock import MockOPTModelDataReader
 
 
+def _make_config(depth_coordinates):
+    """ Build a run configuration for OPTModel tests
+
+    Built once per test class, rather than once per test, to keep test
+    setup cost down to creating the model itself.
+    """
+    config = configparser.ConfigParser()
+    config.add_section("GENERAL")
+    config.set('GENERAL', 'log_level', 'info')
+    config.add_section("SIMULATION")
+    config.set('SIMULATION', 'initialisation_method', 'init_file')
+    config.set('SIMULATION', 'coordinate_system', 'cartesian')
+    config.set('SIMULATION', 'depth_coordinates', depth_coordinates)
+    config.add_section("NUMERICS")
+    config.set('NUMERICS', 'num_method', 'test')
+    config.set('NUMERICS', 'time_step_adv', '1.0')
+
+    return config
+
+
 class OPTModel_test1(TestCase):
     """ Ensure the model behaves sensible given an invalid particle seed """
 
-    def setUp(self):
-        # Create config
-        config = configparser.ConfigParser()
-        config.add_section("GENERAL")
-        config.set('GENERAL', 'log_level', 'info')
-        config.add_section("SIMULATION")
-        config.set('SIMULATION', 'initialisation_method', 'init_file')
-        config.set('SIMULATION', 'coordinate_system', 'cartesian')
-        config.set('SIMULATION', 'depth_coordinates', 'depth_below_surface')
-        config.add_section("NUMERICS")
-        config.set('NUMERICS', 'num_method', 'test')
-        config.set('NUMERICS', 'time_step_adv', '1.0')
+    @classmethod
+    def setUpClass(cls):
+        cls.config = _make_config('depth_below_surface')
 
+    def setUp(self):
         # Create test data reader
         data_reader = MockOPTModelDataReader()
-        
+
         # Create data reader
-        self.model = OPTModel(config, data_reader)
+        self.model = OPTModel(self.config, data_reader)
 
     def tearDown(self):
         del(self.model)
@@ -50,29 +59,21 @@ class OPTModel_test1(TestCase):
 
 class OPTModel_test2(TestCase):
     """ Ensure initial vertical grid positions are properly checked
-    
+
     Checks performed for the case in which vertical coordinates are specified
     relative to the free surface.
     """
 
-    def setUp(self):
-        # Create config
-        config = configparser.ConfigParser()
-        config.add_section("GENERAL")
-        config.set('GENERAL', 'log_level', 'info')
-        config.add_section("SIMULATION")
-        config.set('SIMULATION', 'initialisation_method', 'init_file')
-        config.set('SIMULATION', 'coordinate_system', 'cartesian')
-        config.set('SIMULATION', 'depth_coordinates', 'depth_below_surface')
-        config.add_section("NUMERICS")
-        config.set('NUMERICS', 'num_method', 'test')
-        config.set('NUMERICS', 'time_step_adv', '1.0')
+    @classmethod
+    def setUpClass(cls):
+        cls.config = _make_config('depth_below_surface')
 
+    def setUp(self):
         # Create test data reader
         data_reader = MockOPTModelDataReader()
-        
+
         # Create data reader
-        self.model = OPTModel(config, data_reader)
+        self.model = OPTModel(self.config, data_reader)
 
     def tearDown(self):
         del(self.model)
@@ -89,29 +90,21 @@ class OPTModel_test2(TestCase):
 
 class OPTModel_test3(TestCase):
     """ Ensure initial vertical grid positions are properly checked
-    
+
     Checks performed for the case in which vertical coordinates are specified
     relative to the sea floor.
     """
 
-    def setUp(self):
-        # Create config
-        config = configparser.ConfigParser()
-        config.add_section("GENERAL")
-        config.set('GENERAL', 'log_level', 'info')
-        config.add_section("SIMULATION")
-        config.set('SIMULATION', 'initialisation_method', 'init_file')
-        config.set('SIMULATION', 'coordinate_system', 'cartesian')
-        config.set('SIMULATION', 'depth_coordinates', 'height_above_bottom')
-        config.add_section("NUMERICS")
-        config.set('NUMERICS', 'num_method', 'test')
-        config.set('NUMERICS', 'time_step_adv', '1.0')
+    @classmethod
+    def setUpClass(cls):
+        cls.config = _make_config('height_above_bottom')
 
+    def setUp(self):
         # Create test data reader
         data_reader = MockOPTModelDataReader()
-        
+
         # Create data reader
-        self.model = OPTModel(config, data_reader)
+        self.model = OPTModel(self.config, data_reader)
 
     def tearDown(self):
         del(self.model)
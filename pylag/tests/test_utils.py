@@ -0,0 +1,76 @@
+from unittest import TestCase
+import numpy.testing as test
+import numpy as np
+import datetime
+
+from pylag.utils import round_time, round_time_scalar, round_time_vectorized
+
+
+class RoundTime_test(TestCase):
+
+    def test_round_datetimes_down_to_the_nearest_hour(self):
+        datetimes = [datetime.datetime(2000, 1, 1, 12, 10, 0)]
+
+        datetimes_rounded = round_time(datetimes, rounding_interval=3600)
+
+        test.assert_array_equal([datetime.datetime(2000, 1, 1, 12, 0, 0)],
+                                datetimes_rounded)
+
+    def test_round_datetimes_up_to_the_nearest_hour(self):
+        datetimes = [datetime.datetime(2000, 1, 1, 12, 50, 0)]
+
+        datetimes_rounded = round_time(datetimes, rounding_interval=3600)
+
+        test.assert_array_equal([datetime.datetime(2000, 1, 1, 13, 0, 0)],
+                                datetimes_rounded)
+
+
+class RoundTimeScalar_test(TestCase):
+
+    def test_round_a_single_datetime_to_the_nearest_hour(self):
+        datetime_raw = datetime.datetime(2000, 1, 1, 12, 50, 0)
+
+        datetime_rounded = round_time_scalar(datetime_raw,
+                                             rounding_interval=3600)
+
+        test.assert_equal(datetime.datetime(2000, 1, 1, 13, 0, 0),
+                          datetime_rounded)
+
+
+class RoundTimeVectorized_test(TestCase):
+
+    def test_round_datetimes_to_the_nearest_hour(self):
+        datetimes = np.array(['2000-01-01T12:10:00',
+                              '2000-01-01T12:50:00'], dtype='datetime64[us]')
+
+        datetimes_rounded = round_time_vectorized(datetimes,
+                                                  rounding_interval=3600)
+
+        expected = np.array(['2000-01-01T12:00:00',
+                             '2000-01-01T13:00:00'], dtype='datetime64[us]')
+        test.assert_array_equal(expected, datetimes_rounded)
+
+    def test_round_datetimes_matches_round_time(self):
+        datetimes = [datetime.datetime(2000, 1, 1, 12, 10, 30),
+                     datetime.datetime(2000, 1, 1, 12, 29, 59),
+                     datetime.datetime(2000, 1, 1, 12, 30, 0),
+                     datetime.datetime(2000, 1, 1, 23, 59, 59)]
+
+        datetimes_rounded = round_time_vectorized(datetimes,
+                                                  rounding_interval=60)
+
+        expected = round_time(datetimes, rounding_interval=60)
+        test.assert_array_equal(expected, datetimes_rounded.tolist())
+
+    def test_round_datetimes_matches_round_time_with_a_non_divisor_interval(self):
+        # With an interval that does not evenly divide a day, rounding
+        # must stay anchored to the start of each day, as in `round_time`
+        datetimes = [datetime.datetime(2000, 1, 2, 0, 0, 20),
+                     datetime.datetime(2000, 1, 2, 12, 0, 3),
+                     datetime.datetime(2000, 1, 2, 23, 59, 59)]
+
+        datetimes_rounded = round_time_vectorized(datetimes,
+                                                  rounding_interval=7)
+
+        expected = round_time(datetimes, rounding_interval=7)
+        test.assert_array_equal(expected, datetimes_rounded.tolist())
@@ -7,6 +7,8 @@ from __future__ import print_function
 
 import datetime
 
+import numpy as np
+
 
 def round_time(datetime_raw, rounding_interval=3600):
     """Apply rounding to datetime objects
@@ -27,12 +29,77 @@ def round_time(datetime_raw, rounding_interval=3600):
     datetime_rounded: List, Datetime
         List of rounded datetime objects
     """
-    datetime_rounded = []
-    for dt in datetime_raw:
-        seconds = (dt - dt.min).seconds
-        rounding = (seconds + rounding_interval/2) // rounding_interval * rounding_interval
-        datetime_rounded.append(dt + datetime.timedelta(0,rounding-seconds,-dt.microsecond))
-    return datetime_rounded
+    return [round_time_scalar(dt, rounding_interval) for dt in datetime_raw]
+
+
+def round_time_scalar(datetime_raw, rounding_interval=3600):
+    """Apply rounding to a single datetime object
+
+    Scalar counterpart to `round_time`, allowing callers that hold a
+    single datetime object to avoid building a one-element list and
+    indexing the result back out.
+
+    Parameters
+    ----------
+    datetime_raw: Datetime
+        Datetime object to which rounding should be applied
+
+    rounding_interval: int, optional
+        No. of seconds to round to (default 3600, or one hour)
+
+    Returns
+    -------
+    datetime_rounded: Datetime
+        Rounded datetime object
+    """
+    seconds = (datetime_raw - datetime_raw.min).seconds
+    rounding = (seconds + rounding_interval/2) // rounding_interval * rounding_interval
+    return datetime_raw + datetime.timedelta(0, rounding-seconds,
+                                             -datetime_raw.microsecond)
+
+
+def round_time_vectorized(datetime_raw, rounding_interval=3600):
+    """Apply rounding to an array of datetime64 objects
+
+    Vectorised counterpart to `round_time` for numpy datetime64 arrays.
+    Rounding is performed with integer arithmetic on the underlying
+    microsecond counts, avoiding a Python-level loop over array elements.
+
+    As in `round_time`, rounding is applied to the number of whole
+    seconds elapsed since midnight on the day of each datetime, so
+    intervals that do not evenly divide a day remain anchored to the
+    start of the day rather than to an absolute epoch.
+
+    Parameters
+    ----------
+    datetime_raw: ndarray
+        Array of datetime64 objects to which rounding should be applied
+
+    rounding_interval: int, optional
+        No. of seconds to round to (default 3600, or one hour)
+
+    Returns
+    -------
+    datetime_rounded: ndarray
+        Array of rounded datetime64 objects with microsecond resolution
+    """
+    us_per_second = 1000000
+    us_per_day = 86400 * us_per_second
+
+    time_us = np.asarray(datetime_raw,
+                         dtype='datetime64[us]').view(np.int64)
+
+    # Whole seconds elapsed since midnight, as used by `round_time_scalar`
+    day_start_us = time_us // us_per_day * us_per_day
+    seconds = (time_us - day_start_us) // us_per_second
+
+    rounded_seconds = ((2 * seconds + rounding_interval)
+                       // (2 * rounding_interval) * rounding_interval)
+    rounded_us = day_start_us + rounded_seconds * us_per_second
+
+    return rounded_us.view('datetime64[us]')
 
 
-__all__ = ['round_time']
+__all__ = ['round_time',
+           'round_time_scalar',
+           'round_time_vectorized']